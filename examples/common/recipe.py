@@ -6,13 +6,25 @@ Focused on querying and answer generation, not resource management
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import openviking as ov
 from openviking_cli.utils.config.open_viking_config import OpenVikingConfig
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Search hits at L0/L1 carry these suffixes and are readable as plain files
+_LEVEL_FILE_SUFFIXES = ("/.abstract.md", "/.overview.md")
+
 
 class Recipe:
     """
@@ -33,8 +45,7 @@ class Recipe:
             data_path: Path to OpenViking data directory
         """
         # Load configuration
-        with open(config_path, "r") as f:
-            self.config_dict = json.load(f)
+        self.config_dict = _json_loads(Path(config_path).read_bytes())
 
         # Extract LLM config
         self.vlm_config = self.config_dict.get("vlm", {})
@@ -42,11 +53,23 @@ class Recipe:
         self.api_key = self.vlm_config.get("api_key")
         self.model = self.vlm_config.get("model")
 
+        # Reuse one HTTP session for all LLM calls so multi-turn chats keep the
+        # connection to the LLM endpoint alive instead of re-handshaking per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+
         # Initialize OpenViking client
         config = OpenVikingConfig.from_dict(self.config_dict)
         self.client = ov.SyncOpenViking(path=data_path, config=config)
         self.client.initialize()
 
+        # Queries in a RAG loop keep hitting the same documents; memoize content reads
+        self._read = lru_cache(maxsize=256)(self.client.read)
+        self._abstract = lru_cache(maxsize=256)(self.client.abstract)
+
     def search(
         self,
         query: str,
@@ -72,44 +95,43 @@ class Recipe:
         # `find` has better performance, but not so smart
         results = self.client.search(query, target_uri=target_uri, score_threshold=score_threshold)
 
-        # Extract top results
-        search_results = []
-        for _i, resource in enumerate(
-            results.resources[:top_k] + results.memories[:top_k]
-        ):  # ignore SKILLs for mvp
-            try:
-                content = self.client.read(resource.uri)
-                search_results.append(
-                    {
-                        "uri": resource.uri,
-                        "score": resource.score,
-                        "content": content,
-                    }
-                )
-                # print(f"  {i + 1}. {resource.uri} (score: {resource.score:.4f})")
-
-            except Exception as e:
-                # Handle directories - read their abstract instead
-                if "is a directory" in str(e):
-                    try:
-                        abstract = self.client.abstract(resource.uri)
-                        search_results.append(
-                            {
-                                "uri": resource.uri,
-                                "score": resource.score,
-                                "content": f"[Directory Abstract] {abstract}",
-                            }
-                        )
-                        # print(f"  {i + 1}. {resource.uri} (score: {resource.score:.4f}) [directory]")
-                    except:
-                        # Skip if we can't get abstract
-                        continue
-                else:
-                    # Skip other errors
-                    continue
+        # Extract top results, fetching their content concurrently
+        hits = results.resources[:top_k] + results.memories[:top_k]  # ignore SKILLs for mvp
+        if not hits:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(hits), 8)) as executor:
+            fetched = executor.map(self._fetch_one, hits)
+            search_results = [r for r in fetched if r is not None]
 
         return search_results
 
+    def _fetch_one(self, resource: Any) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the content of a single search hit
+
+        Args:
+            resource: Matched context from search results
+
+        Returns:
+            Search result dict, or None if the content cannot be read
+        """
+        try:
+            # L0/L1 hits normally point at a readable .abstract.md/.overview.md;
+            # only a bare directory URI needs the abstract lookup
+            if resource.level < 2 and not resource.uri.endswith(_LEVEL_FILE_SUFFIXES):
+                content = f"[Directory Abstract] {self._abstract(resource.uri)}"
+            else:
+                content = self._read(resource.uri)
+        except Exception:
+            # Skip entries we cannot read
+            return None
+
+        return {
+            "uri": resource.uri,
+            "score": resource.score,
+            "content": content,
+        }
+
     def call_llm(
         self, messages: List[Dict[str, str]], temperature: float = 0.7, max_tokens: int = 2048
     ) -> str:
@@ -127,23 +149,37 @@ class Recipe:
         """
         url = f"{self.api_base}/chat/completions"
 
-        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"}
-
         payload = {
             "model": self.model,
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
+            "stream": True,
         }
 
         print(f"🤖 Calling LLM: {self.model}")
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-
-        result = response.json()
-        answer = result["choices"][0]["message"]["content"]
+        # Consume the SSE stream as it arrives instead of buffering the whole completion
+        chunks = []
+        with self.session.post(url, json=payload, stream=True) as response:
+            response.raise_for_status()
+            # Some endpoints ignore stream=True and answer with a plain JSON completion
+            if "text/event-stream" not in response.headers.get("Content-Type", ""):
+                result = _json_loads(response.content)
+                return result["choices"][0]["message"]["content"]
+            for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                choices = _json_loads(data).get("choices")
+                if not choices:
+                    continue
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    chunks.append(content)
 
-        return answer
+        return "".join(chunks)
 
     def query(
         self,
@@ -186,15 +222,14 @@ class Recipe:
         # Step 2: Build context from search results
         context_text = "no relevant information found, try answer based on existing knowledge."
         if search_results:
-            context_text = (
-                "Answer should pivoting to the following:\n<context>\n"
-                + "\n\n".join(
-                    [
-                        f"[Source {i + 1}] (relevance: {r['score']:.4f})\n{r['content']}"
-                        for i, r in enumerate(search_results)
-                    ]
-                )
-                + "\n</context>"
+            sources = "\n\n".join(
+                [
+                    f"[Source {i + 1}] (relevance: {r['score']:.4f})\n{r['content']}"
+                    for i, r in enumerate(search_results)
+                ]
+            )
+            context_text = "".join(
+                ["Answer should pivoting to the following:\n<context>\n", sources, "\n</context>"]
             )
 
         # Step 3: Build messages array for chat completion API
@@ -216,8 +251,7 @@ class Recipe:
             messages.extend(chat_history)
 
         # Build current turn prompt with context and question
-        current_prompt = f"{context_text}\n"
-        current_prompt += f"Question: {user_query}\n\n"
+        current_prompt = "".join([context_text, "\nQuestion: ", user_query, "\n\n"])
 
         # Add current user message
         messages.append({"role": "user", "content": current_prompt})
@@ -245,4 +279,5 @@ class Recipe:
 
     def close(self):
         """Clean up resources"""
+        self.session.close()
         self.client.close()
@@ -5,13 +5,19 @@ Resource Manager - Shared utilities for adding resources to OpenViking
 
 import json
 from pathlib import Path
-from typing import Optional
-
-from rich.console import Console
+from typing import TYPE_CHECKING, Optional
 
 import openviking as ov
 from openviking_cli.utils.config.open_viking_config import OpenVikingConfig
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 def create_client(config_path: str = "./ov.conf", data_path: str = "./data") -> ov.SyncOpenViking:
     """
@@ -24,8 +30,7 @@ def create_client(config_path: str = "./ov.conf", data_path: str = "./data") ->
     Returns:
         Initialized SyncOpenViking client
     """
-    with open(config_path, "r") as f:
-        config_dict = json.load(f)
+    config_dict = _json_loads(Path(config_path).read_bytes())
 
     config = OpenVikingConfig.from_dict(config_dict)
     client = ov.SyncOpenViking(path=data_path, config=config)
@@ -37,7 +42,7 @@ def create_client(config_path: str = "./ov.conf", data_path: str = "./data") ->
 def add_resource(
     client: ov.SyncOpenViking,
     resource_path: str,
-    console: Optional[Console] = None,
+    console: Optional["Console"] = None,
     show_output: bool = True,
 ) -> bool:
     """
@@ -53,6 +58,10 @@ def add_resource(
         True if successful, False otherwise
     """
     if console is None:
+        # Deferred so callers that pass their own console (or only create clients)
+        # do not pay for importing rich
+        from rich.console import Console
+
         console = Console()
 
     try:
@@ -11,12 +11,9 @@ from typing import TYPE_CHECKING
 try:
     from ._version import version as __version__
 except ImportError:
-    try:
-        from importlib.metadata import version
-
-        __version__ = version("openviking")
-    except ImportError:
-        __version__ = "0.0.0+unknown"
+    # Source checkout without the setuptools-scm generated _version.py:
+    # __version__ is resolved from package metadata on first access instead.
+    pass
 
 try:
     from openviking.pyagfs import get_binding_client
@@ -37,36 +34,42 @@ if TYPE_CHECKING:
     OpenViking = SyncOpenViking
 
 
-def __getattr__(name: str):
-    if name == "AsyncOpenViking":
-        from openviking.async_client import AsyncOpenViking
+_EXPORTS = {
+    "AsyncOpenViking": ("openviking.async_client", "AsyncOpenViking"),
+    "SyncOpenViking": ("openviking.sync_client", "SyncOpenViking"),
+    "OpenViking": ("openviking.sync_client", "SyncOpenViking"),
+    "Session": ("openviking.session", "Session"),
+    "AsyncHTTPClient": ("openviking_cli.client.http", "AsyncHTTPClient"),
+    "SyncHTTPClient": ("openviking_cli.client.sync_http", "SyncHTTPClient"),
+    "UserIdentifier": ("openviking_cli.session.user_id", "UserIdentifier"),
+}
 
-        return AsyncOpenViking
-    if name == "SyncOpenViking":
-        from openviking.sync_client import SyncOpenViking
 
-        return SyncOpenViking
-    if name == "OpenViking":
-        from openviking.sync_client import SyncOpenViking
+def _resolve_version() -> str:
+    try:
+        from importlib.metadata import version
 
-        return SyncOpenViking
-    if name == "Session":
-        from openviking.session import Session
+        return version("openviking")
+    except ImportError:
+        return "0.0.0+unknown"
 
-        return Session
-    if name == "AsyncHTTPClient":
-        from openviking_cli.client.http import AsyncHTTPClient
 
-        return AsyncHTTPClient
-    if name == "SyncHTTPClient":
-        from openviking_cli.client.sync_http import SyncHTTPClient
+def __getattr__(name: str):
+    if name == "__version__":
+        value = _resolve_version()
+        globals()[name] = value
+        return value
+    try:
+        module_name, attr_name = _EXPORTS[name]
+    except KeyError as exc:
+        raise AttributeError(name) from exc
 
-        return SyncHTTPClient
-    if name == "UserIdentifier":
-        from openviking_cli.session.user_id import UserIdentifier
+    from importlib import import_module
 
-        return UserIdentifier
-    raise AttributeError(name)
+    value = getattr(import_module(module_name), attr_name)
+    # Cache on the module so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -8,24 +8,55 @@ For HTTP mode, use AsyncHTTPClient or SyncHTTPClient.
 
 from __future__ import annotations
 
+import asyncio
 import threading
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from openviking.client import LocalClient, Session
-from openviking.service.debug_service import SystemStatus
-from openviking.telemetry import TelemetryRequest
-from openviking.utils.search_filters import SearchContextTypeInput
-from openviking_cli.client.base import BaseClient
 from openviking_cli.session.user_id import UserIdentifier
-from openviking_cli.utils import get_logger
-
-if TYPE_CHECKING:
-    from openviking.snapshot_namespace import AsyncSnapshotNamespace
-
-logger = get_logger(__name__)
+from openviking_cli.utils.logger import get_lazy_logger
 
 if TYPE_CHECKING:
+    # The embedded client pulls in the whole service/storage stack; it is only
+    # imported once an AsyncOpenViking is actually constructed.
+    from openviking.client import Session
+    from openviking.service.debug_service import SystemStatus
     from openviking.snapshot_namespace import AsyncSnapshotNamespace
+    from openviking.telemetry import TelemetryRequest
+    from openviking.utils.search_filters import SearchContextTypeInput
+    from openviking_cli.client.base import BaseClient
+
+logger = get_lazy_logger(__name__)
+
+
+# Wrappers that only gate on initialization and forward their arguments
+# unchanged. Once initialized they are replaced by the client's bound methods.
+_FORWARDED_METHODS = (
+    "session",
+    "session_exists",
+    "list_sessions",
+    "get_session",
+    "get_session_context",
+    "get_session_archive",
+    "delete_session",
+    "get_task",
+    "cancel_task",
+    "wait_processed",
+    "build_index",
+    "summarize",
+    "abstract",
+    "overview",
+    "read",
+    "glob",
+    "mv",
+    "mkdir",
+    "stat",
+    "relations",
+    "backup_ovpack",
+    "check_consistency",
+    "get_status",
+    "is_healthy",
+)
 
 
 class AsyncOpenViking:
@@ -42,13 +73,22 @@ class AsyncOpenViking:
 
     _instance: Optional["AsyncOpenViking"] = None
     _lock = threading.Lock()
+    _singleton_initialized: bool = False
+    _initialized: bool = False
+    _init_lock: Optional[asyncio.Lock] = None
 
     def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = object.__new__(cls)
-        return cls._instance
+        # Once the instance exists this is a plain attribute read; the lock is
+        # only contended by the very first construction(s), where it guarantees
+        # a single LocalClient is ever created.
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            instance = cls._instance
+            if instance is None:
+                instance = cls._instance = object.__new__(cls)
+            return instance
 
     def __init__(
         self,
@@ -64,8 +104,17 @@ class AsyncOpenViking:
             actor_peer_id: Optional view filter for the current user's peer collection.
             agent_id: Legacy alias for actor_peer_id.
         """
+        init_args = (path, actor_peer_id, agent_id)
         # Singleton guard for repeated initialization
-        if hasattr(self, "_singleton_initialized") and self._singleton_initialized:
+        if self._singleton_initialized:
+            if any(arg is not None for arg in init_args) and init_args != self._init_args:
+                logger.warning(
+                    "AsyncOpenViking is already initialized with "
+                    "(path, actor_peer_id, agent_id)=%r; ignoring %r. "
+                    "Call AsyncOpenViking.reset() first to reconfigure.",
+                    self._init_args,
+                    init_args,
+                )
             return
 
         self.user = UserIdentifier.the_default_user()
@@ -74,11 +123,14 @@ class AsyncOpenViking:
         # Mark initialized only after LocalClient is successfully constructed.
         self._singleton_initialized = False
 
+        from openviking.client import LocalClient
+
         self._client: BaseClient = LocalClient(
             path=path,
             actor_peer_id=actor_peer_id,
             agent_id=agent_id,
         )
+        self._init_args = init_args
         self._singleton_initialized = True
 
     # ============= Lifecycle methods =============
@@ -87,11 +139,24 @@ class AsyncOpenViking:
         """Initialize OpenViking storage and indexes."""
         await self._client.initialize()
         self._initialized = True
+        # Shadow pass-through wrappers on the instance so API calls after startup
+        # go straight to the client; close() removes them again.
+        for name in _FORWARDED_METHODS:
+            setattr(self, name, getattr(self._client, name))
 
     async def _ensure_initialized(self):
-        """Ensure storage collections are initialized."""
-        if not self._initialized:
-            await self.initialize()
+        """Initialize on first use; callers check ``self._initialized`` first.
+
+        Call sites guard with ``if not self._initialized`` inline so the
+        initialized fast path never creates a coroutine.
+        """
+        # Concurrent first calls wait for a single initialize() instead of
+        # each starting their own.
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if not self._initialized:
+                await self.initialize()
 
     async def close(self) -> None:
         """Close OpenViking and release resources."""
@@ -99,15 +164,28 @@ class AsyncOpenViking:
         if client is not None:
             await client.close()
         self._initialized = False
+        self._init_lock = None
+        for name in ("observer", *_FORWARDED_METHODS):
+            self.__dict__.pop(name, None)
         self._singleton_initialized = False
 
+    async def __aenter__(self) -> AsyncOpenViking:
+        if not self._initialized:
+            await self._ensure_initialized()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
     @classmethod
     async def reset(cls) -> None:
         """Reset the singleton instance (mainly for testing)."""
+        # Only the swap happens under the threading lock; holding it across the
+        # await would block any other thread constructing a client meanwhile.
         with cls._lock:
-            if cls._instance is not None:
-                await cls._instance.close()
-                cls._instance = None
+            instance, cls._instance = cls._instance, None
+        if instance is not None:
+            await instance.close()
 
     # ============= Session methods =============
 
@@ -132,7 +210,8 @@ class AsyncOpenViking:
         Returns:
             True if the session exists, False otherwise
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.session_exists(session_id)
 
     async def create_session(
@@ -150,7 +229,8 @@ class AsyncOpenViking:
             memory_policy: Optional default extraction policy for future commits.
             auto_commit_policy: Optional automatic-commit policy overrides.
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.create_session(
             session_id,
             telemetry=telemetry,
@@ -160,29 +240,34 @@ class AsyncOpenViking:
 
     async def list_sessions(self) -> List[Any]:
         """List all sessions."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.list_sessions()
 
     async def get_session(self, session_id: str, *, auto_create: bool = False) -> Dict[str, Any]:
         """Get session details."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.get_session(session_id, auto_create=auto_create)
 
     async def get_session_context(
         self, session_id: str, token_budget: int = 128_000
     ) -> Dict[str, Any]:
         """Get assembled session context."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.get_session_context(session_id, token_budget=token_budget)
 
     async def get_session_archive(self, session_id: str, archive_id: str) -> Dict[str, Any]:
         """Get one completed archive for a session."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.get_session_archive(session_id, archive_id)
 
     async def delete_session(self, session_id: str) -> None:
         """Delete a session."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         await self._client.delete_session(session_id)
 
     async def add_message(
@@ -210,7 +295,8 @@ class AsyncOpenViking:
 
         If both content and parts are provided, parts takes precedence.
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         semantic_kwargs = {
             key: value
             for key, value in {
@@ -238,7 +324,8 @@ class AsyncOpenViking:
         telemetry: TelemetryRequest = False,
     ) -> Dict[str, Any]:
         """Add multiple messages to a session in a single request."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.batch_add_messages(
             session_id=session_id,
             messages=messages,
@@ -257,7 +344,8 @@ class AsyncOpenViking:
         min_raw_tail_steps: int | None = None,
     ) -> Dict[str, Any]:
         """Commit a session (archive and extract memories)."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         optional_retention = {
             key: value
             for key, value in {
@@ -277,12 +365,14 @@ class AsyncOpenViking:
 
     async def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Query background task status."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.get_task(task_id)
 
     async def cancel_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Cancel a background task."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.cancel_task(task_id)
 
     async def list_tasks(
@@ -293,7 +383,8 @@ class AsyncOpenViking:
         limit: int = 50,
     ) -> list[dict[str, Any]]:
         """List background tasks visible to the current caller."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.list_tasks(
             task_type=task_type,
             status=status,
@@ -309,7 +400,8 @@ class AsyncOpenViking:
         dry_run: bool = False,
     ) -> Dict[str, Any]:
         """Reindex semantic/vector artifacts for a URI."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.reindex(
             uri=uri,
             mode=mode,
@@ -363,7 +455,8 @@ class AsyncOpenViking:
             args: Parser/accessor-specific options (e.g. ``site``, ``max_pages``).
             telemetry: Whether to attach operation telemetry data to the result.
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
 
         if add_type is not None:
             add_type = add_type.strip() or None
@@ -413,7 +506,8 @@ class AsyncOpenViking:
 
     async def wait_processed(self, timeout: float = None) -> Dict[str, Any]:
         """Wait for all queued processing to complete."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.wait_processed(timeout=timeout)
 
     async def build_index(self, resource_uris: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
@@ -423,7 +517,8 @@ class AsyncOpenViking:
         Args:
             resource_uris: Single URI or list of URIs to index.
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.build_index(resource_uris, **kwargs)
 
     async def summarize(self, resource_uris: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
@@ -433,7 +528,8 @@ class AsyncOpenViking:
         Args:
             resource_uris: Single URI or list of URIs to summarize.
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.summarize(resource_uris, **kwargs)
 
     async def add_skill(
@@ -453,7 +549,8 @@ class AsyncOpenViking:
                 user's private ``viking://user/{user_id}/skills`` directory.
                 Pass ``viking://agent/skills`` to install a shared skill.
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.add_skill(
             data=data,
             wait=wait,
@@ -468,7 +565,8 @@ class AsyncOpenViking:
         target_uri: Optional[str] = None,
     ) -> Dict[str, Any]:
         """List installed skills."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.list_skills(
             node_limit=node_limit,
             target_uri=target_uri,
@@ -484,7 +582,8 @@ class AsyncOpenViking:
         target_uri: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Find skills by semantic search."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.find_skills(
             query=query,
             limit=limit,
@@ -504,7 +603,8 @@ class AsyncOpenViking:
         target_uri: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get a skill by name."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.get_skill(
             skill_name=skill_name,
             include_content=include_content,
@@ -525,7 +625,8 @@ class AsyncOpenViking:
         target_uri: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Update an existing skill."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.update_skill(
             skill_name=skill_name,
             data=data,
@@ -542,7 +643,8 @@ class AsyncOpenViking:
         target_uri: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Delete a skill."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.delete_skill(
             skill_name=skill_name,
             target_uri=target_uri,
@@ -557,7 +659,8 @@ class AsyncOpenViking:
         target_uri: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Validate skill data."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.validate_skill(
             data=data,
             strict=strict,
@@ -600,7 +703,8 @@ class AsyncOpenViking:
         Returns:
             FindResult
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         sid = session_id or (session.session_id if session else None)
         return await self._client.search(
             query=query,
@@ -636,7 +740,8 @@ class AsyncOpenViking:
         image: Optional[Any] = None,
     ):
         """Semantic search"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.find(
             query=query,
             target_uri=target_uri,
@@ -657,22 +762,26 @@ class AsyncOpenViking:
 
     async def abstract(self, uri: str) -> str:
         """Read L0 abstract (.abstract.md)"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.abstract(uri)
 
     async def overview(self, uri: str) -> str:
         """Read L1 overview (.overview.md)"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.overview(uri)
 
     async def read(self, uri: str, offset: int = 0, limit: int = -1) -> str:
         """Read file content"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.read(uri, offset=offset, limit=limit)
 
     async def read_raw(self, uri: str, offset: int = 0, limit: int = -1) -> str:
         """Read raw file content, including hidden MEMORY_FIELDS metadata."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         read_raw = getattr(self._client, "read_raw", None)
         if read_raw is not None:
             return await read_raw(uri, offset=offset, limit=limit)
@@ -689,7 +798,8 @@ class AsyncOpenViking:
         processing_mode: str = "semantic_and_vectors",
     ) -> Dict[str, Any]:
         """Write text content to an existing file and refresh semantics/vectors."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.write(
             uri=uri,
             content=content,
@@ -709,7 +819,8 @@ class AsyncOpenViking:
         telemetry: TelemetryRequest = False,
     ) -> Dict[str, Any]:
         """Replace explicit retrieval tags for a file or directory."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.set_tags(
             uri=uri,
             tags=tags,
@@ -718,7 +829,18 @@ class AsyncOpenViking:
             telemetry=telemetry,
         )
 
-    async def ls(self, uri: str, **kwargs) -> List[Any]:
+    async def ls(
+        self,
+        uri: str,
+        simple: bool = False,
+        recursive: bool = False,
+        output: str = "original",
+        abs_limit: int = 256,
+        show_all_hidden: bool = False,
+        node_limit: int = 1000,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc",
+    ) -> List[Any]:
         """
         List directory contents.
 
@@ -730,15 +852,8 @@ class AsyncOpenViking:
             sort_by: Optional sort field, "name" or "mtime"
             sort_order: Sort direction, "asc" or "desc"
         """
-        await self._ensure_initialized()
-        recursive = kwargs.get("recursive", False)
-        simple = kwargs.get("simple", False)
-        output = kwargs.get("output", "original")
-        abs_limit = kwargs.get("abs_limit", 256)
-        show_all_hidden = kwargs.get("show_all_hidden", False)
-        node_limit = kwargs.get("node_limit", 1000)
-        sort_by = kwargs.get("sort_by")
-        sort_order = kwargs.get("sort_order", "asc")
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.ls(
             uri,
             recursive=recursive,
@@ -759,7 +874,8 @@ class AsyncOpenViking:
         timeout: Optional[float] = None,
     ) -> None:
         """Remove resource"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         await self._client.rm(uri, recursive=recursive, wait=wait, timeout=timeout)
 
     async def grep(
@@ -772,7 +888,8 @@ class AsyncOpenViking:
         level_limit: int = 5,
     ) -> Dict:
         """Content search"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.grep(
             uri,
             pattern,
@@ -784,17 +901,20 @@ class AsyncOpenViking:
 
     async def glob(self, pattern: str, uri: str = "viking://") -> Dict:
         """File pattern matching"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.glob(pattern, uri=uri)
 
     async def mv(self, from_uri: str, to_uri: str) -> None:
         """Move resource"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         await self._client.mv(from_uri, to_uri)
 
     async def tree(self, uri: str, **kwargs) -> Dict:
         """Get directory tree"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         output = kwargs.get("output", "original")
         abs_limit = kwargs.get("abs_limit", 128)
         show_all_hidden = kwargs.get("show_all_hidden", False)
@@ -809,19 +929,22 @@ class AsyncOpenViking:
 
     async def mkdir(self, uri: str, description: Optional[str] = None) -> None:
         """Create directory"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         await self._client.mkdir(uri, description=description)
 
     async def stat(self, uri: str) -> Dict:
         """Get resource status"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.stat(uri)
 
     # ============= Relation methods =============
 
     async def relations(self, uri: str) -> List[Dict[str, Any]]:
         """Get relations (returns [{"uri": "...", "reason": "..."}, ...])"""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.relations(uri)
 
     async def link(self, from_uri: str, uris: Any, reason: str = "") -> None:
@@ -833,7 +956,8 @@ class AsyncOpenViking:
             uris: Target URI or list of URIs
             reason: Reason for linking
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         await self._client.link(from_uri, uris, reason)
 
     async def unlink(self, from_uri: str, uri: str) -> None:
@@ -844,7 +968,8 @@ class AsyncOpenViking:
             from_uri: Source URI
             uri: Target URI to remove
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         await self._client.unlink(from_uri, uri)
 
     # ============= Pack methods =============
@@ -865,7 +990,8 @@ class AsyncOpenViking:
         Returns:
             Exported file path
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.export_ovpack(
             uri,
             to,
@@ -882,7 +1008,8 @@ class AsyncOpenViking:
         Returns:
             Exported backup file path
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.backup_ovpack(to, include_vectors=include_vectors)
 
     async def import_ovpack(
@@ -904,7 +1031,8 @@ class AsyncOpenViking:
         Returns:
             Imported root resource URI
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.import_ovpack(
             file_path,
             parent,
@@ -929,7 +1057,8 @@ class AsyncOpenViking:
         Returns:
             Restored root URI
         """
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.restore_ovpack(
             file_path,
             on_conflict=on_conflict,
@@ -940,11 +1069,15 @@ class AsyncOpenViking:
 
     async def check_consistency(self, uri: str) -> Dict[str, Any]:
         """Check filesystem/vector-index consistency for a URI subtree."""
-        await self._ensure_initialized()
+        if not self._initialized:
+            await self._ensure_initialized()
         return await self._client.check_consistency(uri)
 
+    # Status accessors deliberately skip _ensure_initialized: health probes
+    # must answer (reporting unhealthy components) before initialize() runs.
+
     def get_status(self) -> Union[SystemStatus, Dict[str, Any]]:
-        """Get system status.
+        """Get system status. Does not require initialize().
 
         Returns:
             SystemStatus containing health status of all components.
@@ -952,14 +1085,15 @@ class AsyncOpenViking:
         return self._client.get_status()
 
     def is_healthy(self) -> bool:
-        """Quick health check.
+        """Quick health check. Does not require initialize().
 
         Returns:
             True if all components are healthy, False otherwise.
         """
         return self._client.is_healthy()
 
-    @property
+    @cached_property
     def observer(self):
-        """Get observer service for component status."""
+        """Get observer service for component status. Does not require initialize()."""
+        # The observer service lives as long as the client; close() drops the cache.
         return self._client.observer
@@ -7,7 +7,8 @@ Provides client implementations for embedded (LocalClient) and HTTP (AsyncHTTPCl
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from openviking.client.local import LocalClient
@@ -16,34 +17,34 @@ if TYPE_CHECKING:
     from openviking_cli.client.http import AsyncHTTPClient
     from openviking_cli.client.sync_http import SyncHTTPClient
 
-__all__ = [
-    "BaseClient",
-    "AsyncHTTPClient",
-    "SyncHTTPClient",
-    "LocalClient",
-    "Session",
-]
+_EXPORTS = {
+    "BaseClient": ("openviking_cli.client.base", "BaseClient"),
+    "AsyncHTTPClient": ("openviking_cli.client.http", "AsyncHTTPClient"),
+    "SyncHTTPClient": ("openviking_cli.client.sync_http", "SyncHTTPClient"),
+    "LocalClient": ("openviking.client.local", "LocalClient"),
+    "Session": ("openviking.client.session", "Session"),
+}
 
 
-def __getattr__(name: str):
-    if name == "AsyncHTTPClient":
-        from openviking_cli.client.http import AsyncHTTPClient
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr_name = _EXPORTS[name]
+    except KeyError as exc:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
 
-        return AsyncHTTPClient
-    if name == "SyncHTTPClient":
-        from openviking_cli.client.sync_http import SyncHTTPClient
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
 
-        return SyncHTTPClient
-    if name == "LocalClient":
-        from openviking.client.local import LocalClient
 
-        return LocalClient
-    if name == "Session":
-        from openviking.client.session import Session
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(__all__))
 
-        return Session
-    if name == "BaseClient":
-        from openviking_cli.client.base import BaseClient
 
-        return BaseClient
-    raise AttributeError(name)
+__all__ = [
+    "BaseClient",
+    "AsyncHTTPClient",
+    "SyncHTTPClient",
+    "LocalClient",
+    "Session",
+]
@@ -310,14 +310,16 @@ class RagasEvaluator(BaseEvaluator):
 
         eval_results = []
         df = result.to_pandas()
+        # Pull each metric column out once; df.iloc[i] would build a row Series
+        # per sample and metric.
+        metric_columns = {
+            metric.name: df[metric.name].to_numpy()
+            for metric in self.metrics
+            if metric.name in df.columns
+        }
 
         for i, sample in enumerate(dataset.samples):
-            scores = {}
-            for metric in self.metrics:
-                metric_name = metric.name
-                if metric_name in df.columns:
-                    scores[metric_name] = float(df.iloc[i][metric_name])
-
+            scores = {name: float(column[i]) for name, column in metric_columns.items()}
             eval_results.append(EvalResult(sample=sample, scores=scores))
 
         mean_scores = {}
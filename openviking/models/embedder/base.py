@@ -6,6 +6,7 @@ import random
 import time
 import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from threading import Lock
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
@@ -94,6 +95,40 @@ async def embed_compat(
         return await embedder.embed_async(embedding_input, is_query=is_query)
 
 
+# Recent search-query embeddings per embedder instance. Agent loops tend to
+# re-issue the same query text, and a query's embedding does not depend on
+# the indexed data, so repeats can skip the provider call entirely.
+_QUERY_EMBED_CACHE_SIZE = 1024
+_QUERY_EMBED_CACHES: "weakref.WeakKeyDictionary[EmbedderBase, OrderedDict[str, EmbedResult]]" = (
+    weakref.WeakKeyDictionary()
+)
+_QUERY_EMBED_CACHE_LOCK = Lock()
+
+
+async def embed_query_cached(embedder: "EmbedderBase", content: "EmbeddingInput") -> "EmbedResult":
+    """embed_compat(..., is_query=True) with an LRU cache for plain-text queries.
+
+    Multimodal inputs are never cached. Callers must treat the returned
+    result as read-only since it may be shared with later searches.
+    """
+    if not isinstance(content, str):
+        return await embed_compat(embedder, content, is_query=True)
+
+    with _QUERY_EMBED_CACHE_LOCK:
+        cache = _QUERY_EMBED_CACHES.setdefault(embedder, OrderedDict())
+        cached = cache.get(content)
+        if cached is not None:
+            cache.move_to_end(content)
+            return cached
+
+    result = await embed_compat(embedder, content, is_query=True)
+    with _QUERY_EMBED_CACHE_LOCK:
+        cache[content] = result
+        if len(cache) > _QUERY_EMBED_CACHE_SIZE:
+            cache.popitem(last=False)
+    return result
+
+
 def truncate_and_normalize(embedding: List[float], dimension: Optional[int]) -> List[float]:
     """Truncate and L2 normalize embedding vector
 
@@ -16,7 +16,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from openviking.core.retrieval_targets import default_target_directories
-from openviking.models.embedder.base import EmbedResult, embed_compat
+from openviking.models.embedder.base import EmbedResult, embed_query_cached
 from openviking.models.rerank import RerankClient
 from openviking.retrieve.memory_lifecycle import hotness_score
 from openviking.retrieve.retrieval_stats import get_stats_collector
@@ -154,11 +154,7 @@ class HierarchicalRetriever:
                 )
             with telemetry.measure("search.embed_query"):
                 embedding_input = getattr(query, "embedding_input", None) or query.query
-                result: EmbedResult = await embed_compat(
-                    self.embedder,
-                    embedding_input,
-                    is_query=True,
-                )
+                result: EmbedResult = await embed_query_cached(self.embedder, embedding_input)
                 query_vector = result.dense_vector
                 sparse_query_vector = result.sparse_vector
 
@@ -13,7 +13,7 @@ import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import uvicorn
 
@@ -128,8 +128,13 @@ def _resolve_cli_config_for_bot(config_path: Optional[str]) -> Optional[str]:
     return None
 
 
-def main():
-    """Main entry point for openviking-server command."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for openviking-server command.
+
+    Args:
+        argv: Command-line arguments, excluding the program name. Defaults to
+            ``sys.argv[1:]``.
+    """
     parser = argparse.ArgumentParser(
         description="OpenViking HTTP Server",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
@@ -197,7 +202,7 @@ def main():
         help="Directory to store vikingbot log files (default: {storage.workspace or ~/.openviking/data}/bot/logs)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set OPENVIKING_CONFIG_FILE environment variable if --config is provided
     # This allows OpenVikingConfigSingleton to load from the specified config file
@@ -43,7 +43,7 @@ from openviking.utils.skill_processor import SkillProcessor
 from openviking_cli.exceptions import InvalidArgumentError, NotInitializedError
 from openviking_cli.session.user_id import UserIdentifier
 from openviking_cli.utils import get_logger
-from openviking_cli.utils.config import OPENVIKING_ENABLE_RECORDER_ENV, get_openviking_config
+from openviking_cli.utils.config import OPENVIKING_ENABLE_RECORDER_ENV
 from openviking_cli.utils.config.git_config import GitConfig
 from openviking_cli.utils.config.memory_config import SessionAutoCommitConfig
 from openviking_cli.utils.config.open_viking_config import initialize_openviking_config
@@ -313,7 +313,7 @@ class OpenVikingService:
         if self._embedder is None:
             self._embedder = self._config.embedding.get_embedder()
 
-        config = get_openviking_config()
+        config = self._config
 
         if self._encryptor:
             logger.info("Encryption module initialized")
@@ -415,7 +415,7 @@ class OpenVikingService:
             session_service=self._session_service,
         )
         try:
-            session_auto_commit_config = get_openviking_config().memory.session_auto_commit
+            session_auto_commit_config = self._config.memory.session_auto_commit
         except Exception:
             session_auto_commit_config = SessionAutoCommitConfig()
         self._session_service.set_session_auto_commit_config(session_auto_commit_config)
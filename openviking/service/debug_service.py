@@ -4,8 +4,9 @@
 Debug Service - provides system status query and health check.
 """
 
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from openviking.server.identity import RequestContext
 from openviking.storage.vikingdb_manager import VikingDBManager
@@ -24,6 +25,10 @@ from openviking_cli.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Health probes poll is_healthy() far more often than component state changes;
+# the last verdict is reused for this long instead of re-walking every observer.
+_HEALTH_CACHE_TTL_SECONDS = 1.0
+
 
 @dataclass
 class ComponentStatus:
@@ -71,6 +76,8 @@ class ObserverService:
         self._vikingdb = vikingdb
         self._config = config
         self._agfs_client = agfs_client
+        self._health_cache: Optional[Tuple[float, bool]] = None
+        self._model_clients: Optional[Tuple[Any, Any]] = None
 
     def set_dependencies(
         self,
@@ -83,6 +90,8 @@ class ObserverService:
         self._config = config
         if agfs_client is not None:
             self._agfs_client = agfs_client
+        self._health_cache = None
+        self._model_clients = None
 
     @property
     def _dependencies_ready(self) -> bool:
@@ -138,18 +147,7 @@ class ObserverService:
             )
 
         vlm_instance = self._config.vlm.get_vlm_instance()
-        embedding_instance = None
-        rerank_instance = None
-
-        # Get embedding instance if available
-        if self._config.embedding:
-            embedding_instance = self._config.embedding.get_embedder()
-
-        # Get rerank instance if available
-        if self._config.rerank and self._config.rerank.is_available():
-            from openviking.models.rerank import RerankClient
-
-            rerank_instance = RerankClient.from_config(self._config.rerank)
+        embedding_instance, rerank_instance = self._get_model_clients()
 
         observer = ModelsObserver(
             vlm_instance=vlm_instance,
@@ -163,6 +161,29 @@ class ObserverService:
             status=observer.get_status_table(),
         )
 
+    def _get_model_clients(self) -> Tuple[Any, Any]:
+        """Embedding and rerank clients to observe, built once per config.
+
+        get_embedder()/RerankClient.from_config() construct new provider clients on
+        every call, so status polling would otherwise rebuild them each time.
+        """
+        if self._model_clients is None:
+            embedding_instance = None
+            rerank_instance = None
+
+            # Get embedding instance if available
+            if self._config.embedding:
+                embedding_instance = self._config.embedding.get_embedder()
+
+            # Get rerank instance if available
+            if self._config.rerank and self._config.rerank.is_available():
+                from openviking.models.rerank import RerankClient
+
+                rerank_instance = RerankClient.from_config(self._config.rerank)
+
+            self._model_clients = (embedding_instance, rerank_instance)
+        return self._model_clients
+
     @property
     def lock(self) -> ComponentStatus:
         """Get lock system status via pathlock_observe snapshot."""
@@ -261,7 +282,13 @@ class ObserverService:
         """Quick health check."""
         if not self._dependencies_ready:
             return False
-        return self.system().is_healthy
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and now - cached[0] < _HEALTH_CACHE_TTL_SECONDS:
+            return cached[1]
+        healthy = self.system().is_healthy
+        self._health_cache = (now, healthy)
+        return healthy
 
 
 class DebugService:
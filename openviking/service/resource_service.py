@@ -1850,12 +1850,4 @@ class ResourceService:
             status = await qm.wait_complete(timeout=timeout)
         except TimeoutError as exc:
             raise DeadlineExceededError("queue processing", timeout) from exc
-        return {
-            name: {
-                "processed": s.processed,
-                "requeue_count": getattr(s, "requeue_count", 0),
-                "error_count": s.error_count,
-                "errors": [{"message": e.message} for e in s.errors],
-            }
-            for name, s in status.items()
-        }
+        return build_queue_status_payload(status)
@@ -10,6 +10,7 @@ similar to how init_viking_fs encapsulates VikingFS initialization.
 import asyncio
 import hashlib
 import json
+import logging
 import threading
 import time
 from contextlib import nullcontext
@@ -804,10 +805,7 @@ class TextEmbeddingHandler(DequeueHandlerBase):
                         embedding_msg,
                         f"Failed to write to vector database: {db_err}",
                     )
-                    logger.error(error_msg)
-                    import traceback
-
-                    traceback.print_exc()
+                    logger.error(error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
                     self._merge_request_stats(embedding_msg.telemetry_id, error_count=1)
                     request_failed_message = error_msg
                     report_error_args = (error_msg, data)
@@ -824,10 +822,7 @@ class TextEmbeddingHandler(DequeueHandlerBase):
                 embedding_msg,
                 f"Error processing embedding message: {e}",
             )
-            logger.error(error_msg)
-            import traceback
-
-            traceback.print_exc()
+            logger.error(error_msg, exc_info=logger.isEnabledFor(logging.DEBUG))
             if embedding_msg is not None:
                 self._merge_request_stats(embedding_msg.telemetry_id, error_count=1)
                 request_failed_message = error_msg
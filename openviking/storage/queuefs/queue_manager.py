@@ -418,8 +418,11 @@ class QueueManager:
         """Wait for completion and return final status."""
         start = time.time()
         while True:
-            if await self.is_all_complete(queue_name):
-                return await self.check_status(queue_name)
+            # One status snapshot per poll: when everything is already drained it
+            # is returned as-is instead of being fetched a second time.
+            statuses = await self.check_status(queue_name)
+            if all(s.is_complete for s in statuses.values()):
+                return statuses
             if timeout and (time.time() - start) > timeout:
                 raise TimeoutError(f"Queue processing not complete after {timeout}s")
             await asyncio.sleep(poll_interval)
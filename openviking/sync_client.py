@@ -8,14 +8,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from openviking.async_client import AsyncOpenViking
+from openviking_cli.utils import run_async
+
 if TYPE_CHECKING:
     from openviking.session import Session
     from openviking.snapshot_namespace import SyncSnapshotNamespace
-
-from openviking.async_client import AsyncOpenViking
-from openviking.telemetry import TelemetryRequest
-from openviking.utils.search_filters import SearchContextTypeInput
-from openviking_cli.utils import run_async
+    from openviking.telemetry import TelemetryRequest
+    from openviking.utils.search_filters import SearchContextTypeInput
 
 
 class SyncOpenViking:
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import json
 import os
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Dict
 
@@ -60,6 +61,19 @@ ERROR_CODE_TO_EXCEPTION = {
 }
 
 
+_DEFAULT_HTTP_MAX_CONNECTIONS = 512
+
+
+def _http_max_connections() -> int:
+    """Connection pool ceiling, overridable via OPENVIKING_HTTP_MAX_CONNECTIONS."""
+    raw = os.getenv("OPENVIKING_HTTP_MAX_CONNECTIONS", "").strip()
+    try:
+        value = int(raw) if raw else 0
+    except ValueError:
+        value = 0
+    return value if value > 0 else _DEFAULT_HTTP_MAX_CONNECTIONS
+
+
 def _timeout_configured_outside_call() -> bool:
     if os.getenv("OPENVIKING_TIMEOUT"):
         return True
@@ -108,6 +122,11 @@ def _raise_legacy_exception(error: Dict[str, Any]) -> None:
     raise exc_class(message)
 
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it httpx
+# refuses http2=True, so only ask for it when it can be honoured.
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
 class AsyncHTTPClient(import_openviking_sdk().AsyncHTTPClient):
     def __init__(self, *args, **kwargs):
         # Heavy local benchmark runs can keep OpenViking search requests queued
@@ -135,7 +154,11 @@ class AsyncHTTPClient(import_openviking_sdk().AsyncHTTPClient):
     async def initialize(self) -> None:
         # The upstream SDK uses httpx defaults (max_connections=100). High-parallel
         # tau2 rollouts can exceed that from one shared client and hit PoolTimeout
-        # while waiting for a free connection, so raise the pool ceiling.
+        # while waiting for a free connection, so raise the pool ceiling. Idle
+        # connections are also kept for 30s (httpx default: 5s) so the gaps
+        # between calls in an agent loop don't force fresh TCP/TLS handshakes.
+        # Deployments with wider fan-out can raise the ceiling further through
+        # OPENVIKING_HTTP_MAX_CONNECTIONS.
         headers: Dict[str, str] = {}
         if getattr(self, "_api_key", None):
             headers["X-API-Key"] = self._api_key
@@ -147,8 +170,8 @@ class AsyncHTTPClient(import_openviking_sdk().AsyncHTTPClient):
             headers["X-OpenViking-Actor-Peer"] = self._actor_peer_id
         headers.update(getattr(self, "_extra_headers", {}) or {})
 
-        max_connections = 512
-        max_keepalive = 128
+        max_connections = _http_max_connections()
+        max_keepalive = min(128, max_connections)
         self._http = httpx.AsyncClient(
             base_url=self._url,
             headers=headers,
@@ -157,7 +180,9 @@ class AsyncHTTPClient(import_openviking_sdk().AsyncHTTPClient):
             limits=httpx.Limits(
                 max_connections=max_connections,
                 max_keepalive_connections=max_keepalive,
+                keepalive_expiry=30.0,
             ),
+            http2=_HTTP2_AVAILABLE,
         )
         observer_cls = getattr(import_openviking_sdk().client, "_HTTPObserver", None)
         if observer_cls is not None:
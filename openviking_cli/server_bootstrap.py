@@ -16,6 +16,7 @@ need a running server).
 
 import os
 import sys
+from typing import List, Optional
 
 from openviking_cli.utils.config import OPENVIKING_CONFIG_ENV
 
@@ -55,9 +56,40 @@ def _maybe_offer_init() -> None:
     if code != 0 or _config_missing():
         sys.exit(code or 1)
 
+    # Start the server from a fresh interpreter so the wizard's modules are not
+    # kept resident for the lifetime of the long-running server process.
+    os.execv(
+        sys.executable, [sys.executable, "-m", "openviking_cli.server_bootstrap", *sys.argv[1:]]
+    )
+
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named by ``argv[1]``, or None for a plain server run."""
+    if len(argv) > 1 and not argv[1].startswith("-"):
+        return argv[1]
+    return None
+
+
+def _installed_version() -> Optional[str]:
+    """Read the installed distribution version without importing ``openviking``."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("openviking")
+    except PackageNotFoundError:
+        return None
+
 
 def main():
     """Bootstrap the server while binding a stable execution-level log trace ID."""
+    # `openviking-server --version` is answered from package metadata, before the
+    # server module (uvicorn, FastAPI app, argparse tree) is ever imported.
+    if sys.argv[1:] == ["--version"]:
+        installed = _installed_version()
+        if installed is not None:
+            print(f"openviking-server {installed}")
+            return
+
     # Pre-parse --config from sys.argv before any openviking imports,
     # so the env var is visible when the config singleton first initialises.
     # This is done for all subcommands (init, doctor, server) to ensure
@@ -74,21 +106,23 @@ def main():
     # module-level loggers.
     from openviking_cli.utils.logger import bind_log_execution_trace  # noqa: PLC0415
 
-    # Intercept subcommands that don't need the server.
-    if len(sys.argv) > 1 and sys.argv[1] == "init":
+    # Intercept subcommands that don't need the server. Only the selected
+    # subcommand's module is imported; the server argparse tree is never built.
+    subcommand = _sniff_subcommand(sys.argv)
+    if subcommand == "init":
         from openviking_cli.setup_wizard import main as init_main
 
         with bind_log_execution_trace():
             sys.exit(init_main())
 
-    if len(sys.argv) > 1 and sys.argv[1] == "doctor":
+    if subcommand == "doctor":
         from openviking_cli.doctor import main as doctor_main
 
         with bind_log_execution_trace():
             sys.exit(doctor_main())
 
     # `openviking-server ingest ...` runs the local-log ingestion CLI (client-side).
-    if len(sys.argv) > 1 and sys.argv[1] == "ingest":
+    if subcommand == "ingest":
         from openviking.ingest.cli import app as ingest_app
 
         with bind_log_execution_trace():
@@ -101,7 +135,7 @@ def main():
     from openviking.server.bootstrap import main as _real_main
 
     with bind_log_execution_trace():
-        _real_main()
+        _real_main(sys.argv[1:])
 
 
 if __name__ == "__main__":
@@ -13,7 +13,7 @@ import threading
 from contextlib import contextmanager
 from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
-from typing import Any, Iterator, Optional, Tuple
+from typing import Any, Iterator, Optional, Tuple, cast
 from uuid import uuid4
 
 from openviking.observability.context import (
@@ -909,16 +909,29 @@ def get_logger(
 class _LazyDefaultLogger:
     """Compatibility proxy that defers logger creation until first use."""
 
-    def _logger(self) -> logging.Logger:
-        return get_logger()
+    def __init__(self, logger_name: str = "openviking") -> None:
+        self._logger_name = logger_name
+        self._logger: Optional[logging.Logger] = None
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._logger(), name)
+        logger = self._logger
+        if logger is None:
+            logger = self._logger = get_logger(self._logger_name)
+        return getattr(logger, name)
 
 
 default_logger = _LazyDefaultLogger()
 
 
+def get_lazy_logger(name: str) -> logging.Logger:
+    """Like get_logger, but log config is only loaded on the first log call.
+
+    Use for module-level loggers in import-sensitive modules, where calling
+    get_logger at import time would initialise the config singleton early.
+    """
+    return cast(logging.Logger, _LazyDefaultLogger(name))
+
+
 def reconfigure_logging() -> None:
     """Re-apply logging configuration to already-created OpenViking loggers."""
     log_level_str, log_format, log_output, config = _load_log_config()
@@ -117,11 +117,30 @@ def _unknown_field_error(path: str, key: str, allowed_keys: set[str]) -> ValueEr
     return ValueError(message)
 
 
+# Parsed ovcli.conf per path, keyed on (mtime_ns, size) so an edited file is
+# picked up while repeated client construction skips the read and validation.
+_OVCLI_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], OVCLIConfig]] = {}
+
+
 def load_ovcli_config(config_path: Optional[str] = None) -> Optional[OVCLIConfig]:
     path = Path(config_path).expanduser() if config_path else _resolve_ovcli_config_path()
-    if path is None or not path.exists():
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
         return None
 
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _OVCLI_CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    config = _parse_ovcli_config(path)
+    _OVCLI_CONFIG_CACHE[path] = (stamp, config)
+    return config
+
+
+def _parse_ovcli_config(path: Path) -> OVCLIConfig:
     try:
         raw = json.loads(path.read_text())
     except json.JSONDecodeError as exc:
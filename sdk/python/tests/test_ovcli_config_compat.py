@@ -213,3 +213,23 @@ def test_async_http_client_rejects_explicit_actor_peer_id_and_agent_id_together(
             actor_peer_id="actor-a",
             agent_id="legacy-agent",
         )
+
+
+def test_ovcli_config_is_reparsed_only_when_the_file_changes(tmp_path, monkeypatch):
+    import os
+
+    from openviking_sdk import config as config_module
+
+    config_path = tmp_path / "ovcli.conf"
+    config_path.write_text(json.dumps({"url": "http://first-host:1933"}))
+
+    first = config_module.load_ovcli_config(str(config_path))
+    assert config_module.load_ovcli_config(str(config_path)) is first
+
+    config_path.write_text(json.dumps({"url": "http://second-host:19330"}))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = config_module.load_ovcli_config(str(config_path))
+    assert second is not first
+    assert second.url == "http://second-host:19330"
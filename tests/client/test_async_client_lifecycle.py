@@ -0,0 +1,107 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: AGPL-3.0
+
+"""Singleton and initialization lifecycle of the embedded client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from openviking.async_client import AsyncOpenViking
+
+
+async def test_async_openviking_skips_init_gate_until_closed():
+    client = object.__new__(AsyncOpenViking)
+    client._initialized = False
+    client._client = MagicMock(
+        initialize=AsyncMock(),
+        close=AsyncMock(),
+        ls=AsyncMock(return_value=[]),
+        stat=AsyncMock(return_value={}),
+    )
+
+    await client.ls("viking://")
+    await client.ls("viking://")
+    client._client.initialize.assert_awaited_once()
+    assert client.stat == client._client.stat
+    await client.stat("viking://")
+    client._client.stat.assert_awaited_once_with("viking://")
+
+    await client.close()
+    assert "stat" not in client.__dict__
+
+    await client.ls("viking://")
+    assert client._client.initialize.await_count == 2
+
+
+def test_async_openviking_warns_when_singleton_args_are_ignored(monkeypatch):
+    import openviking.async_client as async_client_module
+
+    monkeypatch.setattr(AsyncOpenViking, "_instance", None)
+    monkeypatch.setattr("openviking.client.LocalClient", MagicMock(), raising=False)
+    logger = MagicMock()
+    monkeypatch.setattr(async_client_module, "logger", logger)
+
+    first = AsyncOpenViking(path="./data-a")
+    assert AsyncOpenViking() is first
+    logger.warning.assert_not_called()
+
+    assert AsyncOpenViking(path="./data-b") is first
+    logger.warning.assert_called_once()
+    assert first._init_args == ("./data-a", None, None)
+
+
+async def test_async_openviking_concurrent_first_calls_initialize_once():
+    async def slow_initialize():
+        await asyncio.sleep(0)
+
+    client = object.__new__(AsyncOpenViking)
+    client._initialized = False
+    client._client = MagicMock(
+        initialize=AsyncMock(side_effect=slow_initialize),
+        ls=AsyncMock(return_value=[]),
+    )
+
+    await asyncio.gather(*(client.ls("viking://") for _ in range(5)))
+
+    client._client.initialize.assert_awaited_once()
+    assert client._client.ls.await_count == 5
+
+
+async def test_async_openviking_observer_is_cached_until_close():
+    client = object.__new__(AsyncOpenViking)
+    client._initialized = False
+    client._client = MagicMock(close=AsyncMock())
+
+    observer = client.observer
+    assert client.observer is observer
+
+    await client.close()
+    client._client.observer = MagicMock()
+    assert client.observer is client._client.observer
+
+
+async def test_async_openviking_async_context_manager_closes_on_exit():
+    client = object.__new__(AsyncOpenViking)
+    client._initialized = False
+    client._client = MagicMock(initialize=AsyncMock(), close=AsyncMock())
+
+    async with client as entered:
+        assert entered is client
+        assert client._initialized
+
+    client._client.initialize.assert_awaited_once()
+    client._client.close.assert_awaited_once()
+    assert not client._initialized
+
+
+async def test_async_openviking_reset_closes_outside_the_class_lock(monkeypatch):
+    instance = object.__new__(AsyncOpenViking)
+    monkeypatch.setattr(AsyncOpenViking, "_instance", instance)
+
+    async def close():
+        assert not AsyncOpenViking._lock.locked()
+        assert AsyncOpenViking._instance is None
+
+    instance.close = close
+
+    await AsyncOpenViking.reset()
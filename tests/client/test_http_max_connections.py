@@ -0,0 +1,28 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: AGPL-3.0
+
+import pytest
+
+from openviking_cli.client._http_compat import (
+    _DEFAULT_HTTP_MAX_CONNECTIONS,
+    _http_max_connections,
+)
+
+
+def test_http_max_connections_defaults_when_unset(monkeypatch):
+    monkeypatch.delenv("OPENVIKING_HTTP_MAX_CONNECTIONS", raising=False)
+
+    assert _http_max_connections() == _DEFAULT_HTTP_MAX_CONNECTIONS
+
+
+def test_http_max_connections_reads_env(monkeypatch):
+    monkeypatch.setenv("OPENVIKING_HTTP_MAX_CONNECTIONS", " 64 ")
+
+    assert _http_max_connections() == 64
+
+
+@pytest.mark.parametrize("raw", ["many", "1.5", "0", "-8"])
+def test_http_max_connections_ignores_invalid_values(monkeypatch, raw):
+    monkeypatch.setenv("OPENVIKING_HTTP_MAX_CONNECTIONS", raw)
+
+    assert _http_max_connections() == _DEFAULT_HTTP_MAX_CONNECTIONS
@@ -420,6 +420,34 @@ class TestObserverService:
         service = ObserverService(vikingdb=MagicMock(), config=mock_config)
         assert service.is_healthy() is False
 
+    @patch("openviking.service.debug_service.ModelsObserver")
+    def test_models_property_builds_model_clients_once(self, mock_observer_cls):
+        """Test models property reuses the embedding client across status calls."""
+        mock_config = MagicMock()
+        mock_config.rerank = None
+        service = ObserverService(config=mock_config)
+
+        assert service.models.name == "models"
+        assert service.models.name == "models"
+        assert mock_config.embedding.get_embedder.call_count == 1
+
+        service.set_dependencies(vikingdb=MagicMock(), config=mock_config)
+        assert service.models.name == "models"
+        assert mock_config.embedding.get_embedder.call_count == 2
+
+    def test_is_healthy_reuses_recent_verdict(self):
+        """Test is_healthy does not re-walk the observers within the cache TTL."""
+        service = ObserverService(vikingdb=MagicMock(), config=MagicMock())
+        system_status = SystemStatus(is_healthy=True, components={}, errors=[])
+        with patch.object(service, "system", return_value=system_status) as mock_system:
+            assert service.is_healthy() is True
+            assert service.is_healthy() is True
+            assert mock_system.call_count == 1
+
+            service.set_dependencies(vikingdb=MagicMock(), config=MagicMock())
+            assert service.is_healthy() is True
+            assert mock_system.call_count == 2
+
 
 class TestDebugService:
     """Tests for DebugService class."""
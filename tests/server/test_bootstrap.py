@@ -42,7 +42,7 @@ def test_main_keeps_config_host_when_cli_host_is_omitted(monkeypatch):
     monkeypatch.setattr(
         bootstrap.argparse.ArgumentParser,
         "parse_args",
-        lambda self: SimpleNamespace(
+        lambda self, args=None: SimpleNamespace(
             host=None,
             port=None,
             config=None,
@@ -96,7 +96,7 @@ def test_main_coerces_cli_host_all_to_none(monkeypatch):
     monkeypatch.setattr(
         bootstrap.argparse.ArgumentParser,
         "parse_args",
-        lambda self: SimpleNamespace(
+        lambda self, args=None: SimpleNamespace(
             host="all",
             port=None,
             config=None,
@@ -138,7 +138,7 @@ def test_main_enables_bot_logging_when_with_bot_comes_from_config(monkeypatch):
     monkeypatch.setattr(
         bootstrap.argparse.ArgumentParser,
         "parse_args",
-        lambda self: SimpleNamespace(
+        lambda self, args=None: SimpleNamespace(
             host=None,
             port=None,
             config=None,
@@ -180,7 +180,7 @@ def test_bot_alias_propagates_resolved_config_to_workers(monkeypatch):
     captured = {}
     original_parse_args = bootstrap.argparse.ArgumentParser.parse_args
 
-    def parse_bot_alias(parser):
+    def parse_bot_alias(parser, args=None):
         args = original_parse_args(parser, ["--bot", "--workers", "2", "--bot-port", "19000"])
         captured["with_bot"] = args.with_bot
         return args
@@ -1,6 +1,9 @@
 # Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
 # SPDX-License-Identifier: AGPL-3.0
-"""Focused tests for QueueManager concurrency selection."""
+"""Focused tests for QueueManager concurrency selection and status polling."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from openviking.storage.queuefs.queue_manager import QueueManager
 
@@ -15,3 +18,13 @@ def test_session_commit_concurrent_stays_at_four() -> None:
     manager = QueueManager(agfs=object(), max_concurrent_external_parse=9)
 
     assert manager._max_concurrent_for_queue(manager.SESSION_COMMIT) == 4
+
+
+async def test_wait_complete_reads_drained_status_once() -> None:
+    manager = QueueManager(agfs=object())
+    status = SimpleNamespace(is_complete=True)
+    queue = SimpleNamespace(get_status=AsyncMock(return_value=status))
+    manager._queues = {manager.EMBEDDING: queue}
+
+    assert await manager.wait_complete() == {manager.EMBEDDING: status}
+    queue.get_status.assert_awaited_once()
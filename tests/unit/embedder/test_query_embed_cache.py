@@ -0,0 +1,53 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: AGPL-3.0
+"""Tests for the search-query embedding cache."""
+
+from openviking.models.embedder import base
+from openviking.models.embedder.base import EmbedResult, embed_query_cached
+
+
+class _CountingEmbedder:
+    supports_multimodal = True
+
+    def __init__(self):
+        self.calls = []
+
+    def prepare_embedding_input(self, content):
+        return content
+
+    async def embed_async(self, content, is_query=False):
+        self.calls.append((content, is_query))
+        return EmbedResult(dense_vector=[float(len(self.calls))])
+
+
+async def test_repeated_text_query_is_embedded_once():
+    embedder = _CountingEmbedder()
+
+    first = await embed_query_cached(embedder, "what is openviking")
+    second = await embed_query_cached(embedder, "what is openviking")
+
+    assert second is first
+    assert embedder.calls == [("what is openviking", True)]
+
+
+async def test_multimodal_queries_bypass_the_cache():
+    embedder = _CountingEmbedder()
+    content = [{"type": "text", "text": "cat"}]
+
+    await embed_query_cached(embedder, content)
+    await embed_query_cached(embedder, content)
+
+    assert len(embedder.calls) == 2
+
+
+async def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(base, "_QUERY_EMBED_CACHE_SIZE", 2)
+    embedder = _CountingEmbedder()
+
+    await embed_query_cached(embedder, "a")
+    await embed_query_cached(embedder, "b")
+    await embed_query_cached(embedder, "a")
+    await embed_query_cached(embedder, "c")
+    await embed_query_cached(embedder, "b")
+
+    assert [content for content, _ in embedder.calls] == ["a", "b", "c", "b"]
@@ -0,0 +1,25 @@
+# Copyright (c) 2026 Beijing Volcano Engine Technology Co., Ltd.
+# SPDX-License-Identifier: AGPL-3.0
+"""Tests for the lazily-resolved module logger proxy."""
+
+import logging
+
+from openviking_cli.utils import logger as logger_module
+
+
+def test_lazy_logger_resolves_once_on_first_use(monkeypatch):
+    calls = []
+
+    def fake_get_logger(name):
+        calls.append(name)
+        return logging.getLogger(name)
+
+    monkeypatch.setattr(logger_module, "get_logger", fake_get_logger)
+    lazy = logger_module.get_lazy_logger("openviking.test_lazy_logger")
+    assert calls == []
+
+    lazy.debug("first")
+    lazy.info("second")
+    assert lazy.name == "openviking.test_lazy_logger"
+
+    assert calls == ["openviking.test_lazy_logger"]